@@ -38,8 +38,22 @@ def _fftconv_faster(x, h, mode):
     .. seealso:: :func: `scipy.signal._signaltools._fftconv_faster`
 
     """
-    # TODO(Dahlia-Chehata): replace with GPU-based constants.
-    return True
+    if x.dtype.char == 'e' or h.dtype.char == 'e':
+        # The direct method accumulates in the input precision
+        return True
+
+    s1, s2 = x.size, h.size
+    if mode == 'full':
+        direct_ops = s1 * s2
+    elif mode == 'valid':
+        direct_ops = (s2 - s1 + 1) * s1 if s2 >= s1 else (s1 - s2 + 1) * s2
+    else:  # mode == 'same'
+        direct_ops = (s1 * s2 if s1 < s2 else
+                      s1 * s2 - (s2 // 2) * ((s2 + 1) // 2))
+
+    # Empirical crossover: for short inputs or few multiply-adds, the cost
+    # of planning and launching cuFFT outweighs the direct computation.
+    return min(s1, s2) >= 64 and direct_ops >= 200_000
 
 
 def convolve(a, v, mode='full'):
@@ -93,6 +107,8 @@ def _fft_convolve(a1, a2, mode):
     dtype = cupy.result_type(a1, a2)
     n1, n2 = a1.shape[-1], a2.shape[-1]
     out_size = cupyx.scipy.fft.next_fast_len(n1 + n2 - 1)
+    # Repeated calls with the same sizes and dtypes reuse their plans from
+    # cupy.fft's plan cache.
     fa1 = fft(a1, out_size)
     fa2 = fft(a2, out_size)
     out = ifft(fa1 * fa2, out_size)
@@ -137,6 +153,9 @@ def _dot_convolve(a1, a2, mode):
         a1 = cupy.pad(a1, (n2 - 1 - pad_size, pad_size))
     elif mode == 'valid':
         out_size = n1 - n2 + 1
+    else:
+        raise ValueError(
+            'acceptable mode flags are `valid`, `same`, or `full`.')
 
     stride = a1.strides[0]
     a1 = stride_tricks.as_strided(a1, (out_size, n2), (stride, stride))
@@ -57,22 +57,42 @@ class _CubReduceBaseType(_cuda_types.TypeBase):
                 f'({self.TempStorage} is expected.)')
         return _internal_types.Data(f'{self}({temp_storage.code})', self)
 
-    @_internal_types.wraps_class_method
-    def Sum(self, env, instance, input) -> _internal_types.Data:
+    # Whether the class provides the overloads taking multiple items per
+    # thread (``T (&inputs)[ITEMS_PER_THREAD]``).
+    _supports_items_per_thread = False
+
+    def _call(self, instance, input, method, args=''):
+        if isinstance(input.ctype, _cuda_types.Tuple):
+            if not self._supports_items_per_thread:
+                raise TypeError(
+                    f'{self} does not support multiple items per thread.')
+            if any(t != self.T for t in input.ctype.types):
+                raise TypeError(
+                    f'Invalid input type {input.ctype}. '
+                    f'(a tuple of {self.T} is expected.)')
+            # Copy the items to a local array to call the overload taking
+            # an array reference.
+            n = len(input.ctype.types)
+            items = ', '.join(f'STD::get<{i}>(_items)' for i in range(n))
+            return _internal_types.Data(
+                f'([&]() {{ auto _items = {input.code}; '
+                f'{self.T} _array[{n}] = {{{items}}}; '
+                f'return {instance.code}.{method}(_array{args}); }})()',
+                self.T)
         if input.ctype != self.T:
             raise TypeError(
                 f'Invalid input type {input.ctype}. ({self.T} is expected.)')
         return _internal_types.Data(
-            f'{instance.code}.Sum({input.code})', input.ctype)
+            f'{instance.code}.{method}({input.code}{args})', input.ctype)
+
+    @_internal_types.wraps_class_method
+    def Sum(self, env, instance, input) -> _internal_types.Data:
+        return self._call(instance, input, 'Sum')
 
     @_internal_types.wraps_class_method
     def Reduce(self, env, instance, input, reduction_op):
-        if input.ctype != self.T:
-            raise TypeError(
-                f'Invalid input type {input.ctype}. ({self.T} is expected.)')
-        return _internal_types.Data(
-            f'{instance.code}.Reduce({input.code}, {reduction_op.code})',
-            input.ctype)
+        return self._call(
+            instance, input, 'Reduce', f', {reduction_op.code}')
 
 
 class _WarpReduceType(_CubReduceBaseType):
@@ -89,6 +109,8 @@ class _WarpReduceType(_CubReduceBaseType):
 
 class _BlockReduceType(_CubReduceBaseType):
 
+    _supports_items_per_thread = True
+
     def __init__(self, T, BLOCK_DIM_X: int) -> None:
         self.T = _cuda_typerules.to_ctype(T)
         self.BLOCK_DIM_X = BLOCK_DIM_X
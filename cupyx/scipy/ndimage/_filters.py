@@ -1183,33 +1183,63 @@ def _rank_filter(input, get_rank, size=None, footprint=None, output=None,
     if cval is cupy.nan:
         raise NotImplementedError("NaN cval is unsupported")
     axes = _util._check_axes(axes, input.ndim)
-    # generate explicit footprint matching axes size
     default_footprint = footprint is None
-    _, footprint, _ = _filters_core._check_size_footprint_structure(
-        len(axes), size, footprint, None, force_footprint=True)
-    if footprint.size == 0:
-        return cupy.zeros_like(input)
-    # check remaining arguments and update based on axes
-    axes, footprint, origins, modes, int_type = _filters_core._check_nd_args(
-        input, footprint, mode, origin, 'footprint', axes=axes)
+    sizes, footprint, _ = _filters_core._check_size_footprint_structure(
+        len(axes), size, footprint, None,
+        force_footprint=not default_footprint)
+    footprint_mask = None
     if default_footprint:
-        filter_size = footprint.size
+        # dense window given by size: the kernel needs no footprint array
+        if 0 in sizes:
+            return cupy.zeros_like(input)
+        axes, _, origins, modes, int_type = _filters_core._check_nd_args(
+            input, None, mode, origin, 'footprint', sizes=sizes, axes=axes)
+        if len(axes) < input.ndim:
+            # same layout as _util._expand_footprint: the window dimensions
+            # keep their order and are placed at the sorted filtered axes
+            w_shape = [1] * input.ndim
+            for sz, ax in zip(sizes, sorted(axes)):
+                w_shape[ax] = sz
+            origins = tuple(_util._expand_origin(input.ndim, axes, origins))
+            modes = tuple(_util._expand_mode(input.ndim, axes, modes))
+            axes = tuple(range(input.ndim))
+        else:
+            w_shape = sizes
+        w_shape = tuple(w_shape)
+        filter_size = internal.prod(w_shape)
     else:
-        filter_size = int(footprint.sum())  # synchronize
+        if footprint.size == 0:
+            return cupy.zeros_like(input)
+        # check remaining arguments and update based on axes
+        axes, footprint, origins, modes, int_type = (
+            _filters_core._check_nd_args(input, footprint, mode, origin,
+                                         'footprint', axes=axes))
+        w_shape = footprint.shape
+        footprint_host = cupy.asnumpy(footprint) != 0  # synchronize
+        filter_size = int(footprint_host.sum())
+        # Sparse footprint: gather only the non-zero offsets. The offsets
+        # are unrolled into straight-line loads and each distinct mask
+        # compiles its own kernel, so this is limited to at most 225
+        # non-zeros (a dense 15x15 window) to bound code size and compile
+        # time; larger footprints keep the loop over the footprint array.
+        if filter_size < footprint.size and filter_size <= 225:
+            footprint_mask = tuple(footprint_host.ravel().tolist())
     rank = get_rank(filter_size)
     if rank < 0 or rank >= filter_size:
         raise RuntimeError('rank not within filter footprint size')
-    if rank == 0:
-        return _min_or_max_filter(input, None, footprint, None, output, modes,
-                                  cval, origins, 'min', axes)
-    if rank == filter_size - 1:
-        return _min_or_max_filter(input, None, footprint, None, output, modes,
-                                  cval, origins, 'max', axes)
-    offsets = _filters_core._origins_to_offsets(origins, footprint.shape)
-    kernel = _get_rank_kernel(filter_size, rank, modes, footprint.shape,
-                              offsets, float(cval), int_type)
-    return _filters_core._call_kernel(kernel, input, footprint, output,
-                                      weights_dtype=bool)
+    if rank == 0 or rank == filter_size - 1:
+        func = 'min' if rank == 0 else 'max'
+        return _min_or_max_filter(
+            input, None, w_shape if default_footprint else footprint, None,
+            output, modes, cval, origins, func, axes)
+    offsets = _filters_core._origins_to_offsets(origins, w_shape)
+    has_weights = not default_footprint and footprint_mask is None
+    kernel = _get_rank_kernel(filter_size, rank, modes, w_shape, offsets,
+                              float(cval), int_type, has_weights,
+                              footprint_mask)
+    return _filters_core._call_kernel(
+        kernel, input, footprint if has_weights else None, output,
+        weights_dtype=bool)
 
 
 __SHELL_SORT = '''
@@ -1240,7 +1270,7 @@ def _get_shell_gap(filter_size):
 
 @cupy._util.memoize(for_each_device=True)
 def _get_rank_kernel(filter_size, rank, modes, w_shape, offsets, cval,
-                     int_type):
+                     int_type, has_weights=True, footprint_mask=None):
     s_rank = min(rank, filter_size - rank - 1)
     # The threshold was set based on the measurements on a V100
     # TODO(leofang, anaruse): Use Optuna to automatically tune the threshold,
@@ -1289,7 +1319,8 @@ def _get_rank_kernel(filter_size, rank, modes, w_shape, offsets, cval,
         f'rank_{filter_size}_{rank}',
         f'int iv = 0;\nX values[{array_size}];',
         'values[iv++] = {value};' + found_post, post,
-        modes, w_shape, int_type, offsets, cval, preamble=sorter)
+        modes, w_shape, int_type, offsets, cval, preamble=sorter,
+        has_weights=has_weights, footprint_mask=footprint_mask)
 
 
 def generic_filter(input, function, size=None, footprint=None,
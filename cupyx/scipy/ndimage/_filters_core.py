@@ -1,3 +1,4 @@
+import hashlib
 import warnings
 
 import numpy
@@ -223,7 +224,8 @@ __device__ __forceinline__ bool nonzero(T x) { return x != static_cast<T>(0); }
 def _generate_nd_kernel(name, pre, found, post, modes, w_shape, int_type,
                         offsets, cval, ctype='X', preamble='', options=(),
                         has_weights=True, has_structure=False, has_mask=False,
-                        binary_morphology=False, all_weights_nonzero=False):
+                        binary_morphology=False, all_weights_nonzero=False,
+                        footprint_mask=None):
     # Currently this code uses CArray for weights but avoids using CArray for
     # the input data and instead does the indexing itself since it is faster.
     # If CArray becomes faster than follow the comments that start with
@@ -304,6 +306,32 @@ def _generate_nd_kernel(name, pre, found, post, modes, w_shape, int_type,
             value = f'(({cond}) ? cast<{ctype}>({cval}) : {value})'
         found = found.format(value=value)
 
+    end_loops = '}'*ndim
+    if footprint_mask is not None:
+        # Sparse footprint: the non-zero offsets are known on the host, so emit
+        # one straight-line load per offset rather than looping over the whole
+        # footprint shape and testing each weight.
+        if has_weights or has_structure:
+            raise ValueError('footprint_mask cannot be used with weights')
+        loops = []
+        for iws in numpy.flatnonzero(footprint_mask):
+            pos = numpy.unravel_index(iws, w_shape)
+            block = ['{']
+            for j in range(ndim):
+                if w_shape[j] == 1:
+                    block.append(
+                        f'{int_type} ix_{j} = ind_{j} * xstride_{j};')
+                    continue
+                boundary = _util._generate_boundary_condition_ops(
+                    modes[j], f'ix_{j}', f'xsize_{j}', int_type)
+                block.append(f'''
+        {int_type} ix_{j} = ind_{j} + {pos[j]};
+        {boundary}
+        ix_{j} *= xstride_{j};''')
+            block.append(f'{{ {found} }}\n}}')
+            loops.append('\n'.join(block))
+        found = end_loops = ''
+
     # CArray: replace comment and next line in string with
     #   {type} inds[{ndim}] = {{0}};
     # and add ndim=ndim, type=int_type to format call
@@ -324,7 +352,7 @@ def _generate_nd_kernel(name, pre, found, post, modes, w_shape, int_type,
     {post}
     '''.format(sizes='\n'.join(sizes), inds=inds, pre=pre, post=post,
                ws_init=ws_init, ws_pre=ws_pre, ws_post=ws_post,
-               loops='\n'.join(loops), found=found, end_loops='}'*ndim)
+               loops='\n'.join(loops), found=found, end_loops=end_loops)
 
     # avoid potential hyphen in kernel name
     if num_unique_modes > 1:
@@ -335,6 +363,10 @@ def _generate_nd_kernel(name, pre, found, post, modes, w_shape, int_type,
         name, ndim, mode_str, '_'.join([f'{x}' for x in w_shape]))
     if all_weights_nonzero:
         name += '_all_nonzero'
+    if footprint_mask is not None:
+        # short digest of the mask keeps the name bounded for large shapes
+        bits = numpy.packbits(numpy.asarray(footprint_mask, dtype=bool))
+        name += '_fp' + hashlib.sha1(bits.tobytes()).hexdigest()[:16]
     if int_type == 'ptrdiff_t':
         name += '_i64'
     if has_structure:
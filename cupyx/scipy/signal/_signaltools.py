@@ -480,7 +480,56 @@ def correlation_lags(in1_len, in2_len, mode='full'):
     return lags
 
 
-def wiener(im, mysize=None, noise=None):
+_wiener_moments_kernel = cupy.ElementwiseKernel(
+    'raw T x, int32 size, int32 n',
+    'C mean, C sqmean',
+    '''
+    // Zero-padded box along the last (contiguous) axis of length n
+    const int pos = i % n;
+    const int lo = max(pos - size / 2, 0) - pos;
+    const int hi = min(pos + (size - 1) / 2, n - 1) - pos;
+    C sum = 0;
+    C sqsum = 0;
+    for (int k = lo; k <= hi; k++) {
+        const C v = x[i + k];
+        sum += v;
+        sqsum += v * v;
+    }
+    mean = sum / (C)size;
+    sqmean = sqsum / (C)size;
+    ''',
+    'cupyx_scipy_signal_wiener_moments',
+)
+
+
+_wiener_kernel = cupy.ElementwiseKernel(
+    'T im, C local_mean, C local_sqmean, C noise',
+    'T out',
+    '''
+    C local_var = local_sqmean - local_mean * local_mean;
+    if (local_var < noise) {
+        out = (T)local_mean;
+    } else {
+        out = (T)(((C)im - local_mean) * ((C)1 - noise / local_var)
+                  + local_mean);
+    }
+    ''',
+    'cupyx_scipy_signal_wiener',
+)
+
+
+_wiener_noise_sum_kernel = cupy.ReductionKernel(
+    'C local_mean, C local_sqmean',
+    'C noise_sum',
+    'local_sqmean - local_mean * local_mean',
+    'a + b',
+    'noise_sum = a',
+    '0',
+    'cupyx_scipy_signal_wiener_noise_sum',
+)
+
+
+def wiener(im, mysize=None, noise=None, dtype=None):
     """Perform a Wiener filter on an N-dimensional array.
 
     Apply a Wiener filter to the N-dimensional array `im`.
@@ -493,34 +542,84 @@ def wiener(im, mysize=None, noise=None):
             scalar is used as the size in each dimension.
         noise (float, optional): The noise-power to use. If None, then noise is
             estimated as the average of the local variance of the input.
+        dtype (dtype, optional): The floating-point or complex data type in
+            which the filter is computed and returned. If None, single
+            precision inputs (``float32`` and ``complex64``) are kept as-is and
+            all other inputs are computed in ``float64`` or ``complex128``.
+            Complex inputs require a complex ``dtype``.
+            With ``float16``, only the image and the result are stored in
+            half precision; the local mean and mean of squares are kept in
+            ``float32``, as the local variance is their difference.
 
     Returns:
         cupy.ndarray: Wiener filtered result with the same shape as `im`.
 
+    .. note::
+        Unlike SciPy, which always computes in double precision, single
+        precision inputs are filtered in single precision by default. Pass
+        ``dtype=cupy.float64`` (or ``cupy.complex128``) to match SciPy.
+
     .. seealso:: :func:`scipy.signal.wiener`
     """
     if mysize is None:
         mysize = 3
     mysize = _util._fix_sequence_arg(mysize, im.ndim, 'mysize', int)
-    im = im.astype(cupy.complex128 if im.dtype.kind == 'c' else cupy.float64,
-                   copy=False)
-
-    # Estimate the local mean
-    local_mean = _filters.uniform_filter(im, mysize, mode='constant')
-
-    # Estimate the local variance
-    local_var = _filters.uniform_filter(im*im, mysize, mode='constant')
-    local_var -= local_mean*local_mean
+    if dtype is None:
+        if im.dtype.char in 'fF':
+            dtype = im.dtype
+        else:
+            dtype = cupy.complex128 if im.dtype.kind == 'c' else cupy.float64
+    else:
+        dtype = cupy.dtype(dtype)
+        if dtype.kind not in 'fc':
+            raise ValueError('dtype must be a floating-point or complex type')
+        if im.dtype.kind == 'c' and dtype.kind != 'c':
+            raise ValueError('dtype must be complex for complex input')
+    im = im.astype(dtype, copy=False)
+    # Half precision is only used for storage of the image and the result;
+    # the local moments stay in single precision, as the local variance
+    # sqmean - mean**2 would otherwise be lost to cancellation
+    compute_dtype = cupy.dtype(
+        cupy.float32 if dtype == cupy.float16 else dtype)
+
+    # Estimate the local mean and the local mean of squares; the local
+    # variance is derived from them inside the filtering kernel.
+    # The box filter is separable: the pass along the last axis computes
+    # both moments while reading im once, then the remaining axes are
+    # filtered with uniform_filter, so the cost per element grows with
+    # sum(mysize) rather than prod(mysize).
+    im = cupy.ascontiguousarray(im)
+    if im.ndim:
+        n, size = im.shape[-1], mysize[-1]
+    else:
+        n, size = 1, 1
+    local_mean = cupy.empty_like(im, dtype=compute_dtype)
+    local_sqmean = cupy.empty_like(im, dtype=compute_dtype)
+    _wiener_moments_kernel(im, size, n, local_mean, local_sqmean)
+    if im.ndim > 1:
+        axes = tuple(range(im.ndim - 1))
+        local_mean = _filters.uniform_filter(
+            local_mean, mysize[:-1], mode='constant', axes=axes)
+        local_sqmean = _filters.uniform_filter(
+            local_sqmean, mysize[:-1], mode='constant', axes=axes)
 
     # Estimate the noise power if needed.
+    # The local variance is summed in a single reduction pass, which is
+    # dispatched to CUB when it is enabled in CUPY_ACCELERATORS.
     if noise is None:
-        noise = local_var.mean()
+        noise = cupy.empty((), compute_dtype)
+        _wiener_noise_sum_kernel(local_mean, local_sqmean, noise)
+        noise /= local_mean.size
+    elif isinstance(noise, cupy.ndarray):
+        noise = noise.astype(compute_dtype, copy=False)
+    else:
+        noise = compute_dtype.type(noise)
 
-    # Perform the filtering
-    res = im - local_mean
-    res *= 1 - noise / local_var
-    res += local_mean
-    return cupy.where(local_var < noise, local_mean, res)
+    # Perform the filtering; unless the result is in half precision, it is
+    # written over local_mean, which is not needed afterwards, to avoid
+    # allocating another full-size array
+    out = local_mean if dtype == compute_dtype else None
+    return _wiener_kernel(im, local_mean, local_sqmean, noise, out)
 
 
 def order_filter(a, domain, rank):
@@ -569,8 +668,8 @@ def medfilt(volume, kernel_size=None):
             in each dimension. Default size is 3 for each dimension.
 
     Returns:
-        cupy.ndarray: An array the same size as input containing the median
-        filtered result.
+        cupy.ndarray: An array the same size and data type as input
+        containing the median filtered result.
 
     .. seealso:: :func:`cupyx.scipy.ndimage.median_filter`
     .. seealso:: :func:`scipy.signal.medfilt`
@@ -594,7 +693,7 @@ def medfilt(volume, kernel_size=None):
                                 mode='constant')
 
 
-def medfilt2d(input, kernel_size=3):
+def medfilt2d(input, kernel_size=3, *, out=None):
     """Median filter a 2-dimensional array.
 
     Apply a median filter to the `input` array using a local window-size given
@@ -607,10 +706,15 @@ def medfilt2d(input, kernel_size=3):
             should be odd. If `kernel_size` is a scalar, then this scalar is
             used as the size in each dimension. Default is a kernel of size
             (3, 3).
+        out (cupy.ndarray, optional): An array of the same shape as input in
+            which to place the result. Reusing it across calls, e.g. when
+            filtering a video frame by frame, avoids allocating a new output
+            array each time.
 
     Returns:
-        cupy.ndarray: An array the same size as input containing the median
-        filtered result.
+        cupy.ndarray: An array the same size and data type as input
+        containing the median filtered result. If `out` is given, `out` is
+        returned.
 
     See also
     --------
@@ -631,8 +735,13 @@ def medfilt2d(input, kernel_size=3):
         # scipy doesn't support complex
         raise ValueError("complex types not supported")
     order = kernel_size[0] * kernel_size[1] // 2
+    if (input.dtype == cupy.uint8 and min(kernel_size) >= 15
+            and kernel_size[0] * kernel_size[1] < 65536):
+        # For large windows on 8-bit images a sliding histogram is much
+        # cheaper than selecting the median from each window
+        return _st_core._medfilt2d_uint8(input, kernel_size, out)
     return _filters.rank_filter(
-        input, order, size=kernel_size, mode='constant')
+        input, order, size=kernel_size, output=out, mode='constant')
 
 
 def lfilter(b, a, x, axis=-1, zi=None):
@@ -1418,13 +1527,32 @@ def deconvolve(signal, divisor):
 
 
 def _get_kernel_size(kernel_size, ndim):
+    # Validation is cached for hashable arguments (None, ints, lists and
+    # tuples) as medfilt and medfilt2d are often called per frame with the
+    # same sizes
+    if isinstance(kernel_size, list):
+        kernel_size = tuple(kernel_size)
+    try:
+        hash(kernel_size)
+    except TypeError:
+        # unhashable kernel_size, e.g. an array
+        return _check_kernel_size(kernel_size, ndim)
+    return _get_kernel_size_cached(kernel_size, ndim)
+
+
+def _check_kernel_size(kernel_size, ndim):
     if kernel_size is None:
         kernel_size = (3,) * ndim
     kernel_size = _util._fix_sequence_arg(kernel_size, ndim,
                                           'kernel_size', int)
     if any((k % 2) != 1 for k in kernel_size):
         raise ValueError("Each element of kernel_size should be odd")
-    return kernel_size
+    return tuple(kernel_size)
+
+
+@cupy._util.memoize()
+def _get_kernel_size_cached(kernel_size, ndim):
+    return _check_kernel_size(kernel_size, ndim)
 
 
 def _validate_sos(sos):
@@ -1689,20 +1817,20 @@ def hilbert(x, N=None, axis=-1):
     if N <= 0:
         raise ValueError("N must be positive.")
 
-    Xf = sp_fft.fft(x, N, axis=axis)
-    h = cupy.zeros(N, dtype=Xf.dtype)
+    # x is real, so only the non-negative half of the spectrum is computed;
+    # the negative frequencies are zeroed anyway by the inverse transform's
+    # zero-padding up to N.
+    Xf = sp_fft.rfft(x, N, axis=axis)
+    h = cupy.full(N // 2 + 1, 2, dtype=Xf.dtype)
+    h[0] = 1
     if N % 2 == 0:
-        h[0] = h[N // 2] = 1
-        h[1:N // 2] = 2
-    else:
-        h[0] = 1
-        h[1:(N + 1) // 2] = 2
+        h[N // 2] = 1
 
     if x.ndim > 1:
         ind = [cupy.newaxis] * x.ndim
         ind[axis] = slice(None)
         h = h[tuple(ind)]
-    x = sp_fft.ifft(Xf * h, axis=axis)
+    x = sp_fft.ifft(Xf * h, N, axis=axis)
     return x
 
 
@@ -300,3 +300,98 @@ def _oa_reshape_inputs(in1, in2, axes, shape_final,
         reshape_size2.insert(iax+i, nsteps2[i])
 
     return in1.reshape(*reshape_size1), in2.reshape(*reshape_size2)
+
+
+MEDFILT2D_UINT8_KERNEL = r"""
+__device__ void update_row(
+        const unsigned char* in, unsigned short* fine, unsigned short* coarse,
+        int row, int delta, int x, int kw, int height, int width) {
+    if (row < 0 || row >= height) {
+        // zero padding
+        fine[0] += delta * kw;
+        coarse[0] += delta * kw;
+        return;
+    }
+    const unsigned char* line = in + (long long)row * width;
+    for (int j = x - kw / 2; j <= x + kw / 2; j++) {
+        const unsigned char v = (j >= 0 && j < width) ? line[j] : 0;
+        fine[v] += delta;
+        coarse[v >> 4] += delta;
+    }
+}
+
+extern "C" __global__ void medfilt2d_uint8_hist(
+        const unsigned char* in, unsigned char* out, int height, int width,
+        int kh, int kw, int rows_per_thread) {
+
+    // Each thread owns one output column and a strip of consecutive rows.
+    // The window histogram is slid down the strip: one row of the window
+    // enters and one leaves per output, and the median is looked up in a
+    // two-level (16 coarse / 256 fine bins) histogram.
+    const int x = blockDim.x * blockIdx.x + threadIdx.x;
+    const int y_start = blockIdx.y * rows_per_thread;
+    if (x >= width || y_start >= height) {
+        return;
+    }
+    const int y_stop = min(y_start + rows_per_thread, height);
+    const int rh = kh / 2;
+    const int rank = kh * kw / 2;
+
+    unsigned short fine[256];
+    unsigned short coarse[16];
+    for (int i = 0; i < 256; i++) {
+        fine[i] = 0;
+    }
+    for (int i = 0; i < 16; i++) {
+        coarse[i] = 0;
+    }
+
+    for (int y = y_start - rh; y < y_start + rh; y++) {
+        update_row(in, fine, coarse, y, 1, x, kw, height, width);
+    }
+    for (int y = y_start; y < y_stop; y++) {
+        update_row(in, fine, coarse, y + rh, 1, x, kw, height, width);
+
+        int count = 0;
+        int c = 0;
+        while (count + coarse[c] <= rank) {
+            count += coarse[c++];
+        }
+        int f = c << 4;
+        while (count + fine[f] <= rank) {
+            count += fine[f++];
+        }
+        out[(long long)y * width + x] = (unsigned char)f;
+
+        update_row(in, fine, coarse, y - rh, -1, x, kw, height, width);
+    }
+}
+"""
+
+
+_medfilt2d_uint8_kernel = cupy.RawKernel(
+    MEDFILT2D_UINT8_KERNEL, 'medfilt2d_uint8_hist')
+
+
+def _medfilt2d_uint8(input, kernel_size, output=None, rows_per_thread=64):
+    # Histogram-based median filter for 8-bit images with zero padding; the
+    # per-pixel cost grows linearly with the window width instead of with
+    # the window area.
+    input = cupy.ascontiguousarray(input)
+    output = _util._get_output(output, input)
+    out = output
+    if (out.dtype != cupy.uint8 or not out.flags.c_contiguous
+            or cupy.shares_memory(out, input, 'MAY_SHARE_BOUNDS')):
+        out = cupy.empty_like(input)
+    height, width = input.shape
+    block_sz = 128
+    grid = ((width + block_sz - 1) // block_sz,
+            (height + rows_per_thread - 1) // rows_per_thread)
+    _medfilt2d_uint8_kernel(
+        grid, (block_sz,),
+        (input, out, cupy.int32(height), cupy.int32(width),
+         cupy.int32(kernel_size[0]), cupy.int32(kernel_size[1]),
+         cupy.int32(rows_per_thread)))
+    if out is not output:
+        output[...] = out
+    return output
@@ -80,6 +80,27 @@ class TestPlanCache(unittest.TestCase):
         # we should get the same plan
         assert plan0 is plan1
 
+    def test_LRU_cache_convolve(self):
+        # test if repeated FFT convolutions of the same shapes reuse plans
+        cache = config.get_plan_cache()
+        assert cache.get_curr_size() == 0 <= cache.get_size()
+
+        a = testing.shaped_random((1000,), cupy, cupy.float32)
+        b = testing.shaped_random((500,), cupy, cupy.float32)
+        assert cupy._math.misc._choose_conv_method(a, b, 'full') == 'fft'
+        cupy.convolve(a, b)
+        # one R2C plan for both inputs and one C2R plan for the output
+        assert cache.get_curr_size() == 2 <= cache.get_size()
+        plans0 = [node.plan for _, node in cache]
+
+        # repeat
+        cupy.convolve(a, b)
+        assert cache.get_curr_size() == 2 <= cache.get_size()
+        plans1 = [node.plan for _, node in cache]
+
+        # we should get the same plans
+        assert set(map(id, plans0)) == set(map(id, plans1))
+
     def test_LRU_cache3(self):
         # test if cache size is limited
         cache = config.get_plan_cache()
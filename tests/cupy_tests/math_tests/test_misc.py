@@ -540,3 +540,15 @@ class TestConvolveInvalid:
             b = testing.shaped_arange((10, 5), xp, dtype)
             with pytest.raises(ValueError):
                 xp.convolve(a, b, mode=self.mode)
+
+
+class TestConvolveInvalidMode:
+
+    @testing.for_dtypes('fd')
+    def test_convolve_invalid_mode(self, dtype):
+        # small inputs take the direct method
+        for xp in (numpy, cupy):
+            a = testing.shaped_arange((10,), xp, dtype)
+            b = testing.shaped_arange((3,), xp, dtype)
+            with pytest.raises(ValueError):
+                xp.convolve(a, b, mode='invalid')
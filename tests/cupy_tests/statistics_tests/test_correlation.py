@@ -183,3 +183,15 @@ class TestCorrelateInvalid(unittest.TestCase):
             b = testing.shaped_arange((1,), xp, dtype)
             with pytest.raises(ValueError):
                 xp.correlate(a, b, mode=self.mode)
+
+
+class TestCorrelateInvalidMode:
+
+    @testing.for_dtypes('fd')
+    def test_correlate_invalid_mode(self, dtype):
+        # small inputs take the direct method
+        for xp in (numpy, cupy):
+            a = testing.shaped_arange((10,), xp, dtype)
+            b = testing.shaped_arange((3,), xp, dtype)
+            with pytest.raises(ValueError):
+                xp.correlate(a, b, mode='invalid')
@@ -1,3 +1,5 @@
+import pytest
+
 import cupy
 from cupy import testing
 from cupy_backends.cuda.api import runtime
@@ -78,6 +80,26 @@ class TestCubWarpReduce:
         warp_reduce_max[h, w](x, y)
         testing.assert_allclose(y, expected, rtol=1e-6)
 
+    def test_sum_items_per_thread_unsupported(self):
+
+        @jit.rawkernel()
+        def warp_reduce_sum(x, y):
+            WarpReduce = jit.cub.WarpReduce[cupy.float32]
+            temp_storage = jit.shared_memory(
+                dtype=WarpReduce.TempStorage, size=1)
+            i, j = jit.blockIdx.x, jit.threadIdx.x
+            value = (x[i, j, 0], x[i, j, 1])
+            aggregator = WarpReduce(temp_storage[0])
+            aggregate = aggregator.Sum(value)
+            if j == 0:
+                y[i] = aggregate
+
+        warp_size = 64 if runtime.is_hip else 32
+        x = testing.shaped_random((1, warp_size, 2), dtype=cupy.float32)
+        y = testing.shaped_random((1,), dtype=cupy.float32)
+        with pytest.raises(TypeError):
+            warp_reduce_sum[1, warp_size](x, y)
+
 
 class TestCubBlockReduce:
 
@@ -104,6 +126,52 @@ class TestCubBlockReduce:
         block_reduce_sum[h, w](x, y)
         testing.assert_allclose(y, expected, rtol=1e-6)
 
+    @testing.for_all_dtypes(no_bool=True)
+    def test_sum_items_per_thread(self, dtype):
+
+        @jit.rawkernel()
+        def block_reduce_sum(x, y):
+            BlockReduce = jit.cub.BlockReduce[dtype, 64]
+            temp_storage = jit.shared_memory(
+                dtype=BlockReduce.TempStorage, size=1)
+            i, j = jit.blockIdx.x, jit.threadIdx.x
+            value = (x[i, j, 0], x[i, j, 1], x[i, j, 2], x[i, j, 3])
+            aggregator = BlockReduce(temp_storage[0])
+            aggregate = aggregator.Sum(value)
+            if j == 0:
+                y[i] = aggregate
+
+        h, w, items = (32, 64, 4)
+        x = testing.shaped_random((h, w, items), dtype=dtype)
+        y = testing.shaped_random((h,), dtype=dtype)
+        expected = cupy.asnumpy(x).sum(axis=(1, 2), dtype=dtype)
+
+        block_reduce_sum[h, w](x, y)
+        testing.assert_allclose(y, expected, rtol=1e-6)
+
+    @testing.for_all_dtypes(no_bool=True)
+    def test_reduce_max_items_per_thread(self, dtype):
+
+        @jit.rawkernel()
+        def block_reduce_max(x, y):
+            BlockReduce = jit.cub.BlockReduce[dtype, 64]
+            temp_storage = jit.shared_memory(
+                dtype=BlockReduce.TempStorage, size=1)
+            i, j = jit.blockIdx.x, jit.threadIdx.x
+            value = (x[i, j, 0], x[i, j, 1], x[i, j, 2], x[i, j, 3])
+            aggregator = BlockReduce(temp_storage[0])
+            aggregate = aggregator.Reduce(value, jit.cub.Max())
+            if j == 0:
+                y[i] = aggregate
+
+        h, w, items = (32, 64, 4)
+        x = testing.shaped_random((h, w, items), dtype=dtype)
+        y = testing.shaped_random((h,), dtype=dtype)
+        expected = cupy.asnumpy(x).max(axis=(1, 2))
+
+        block_reduce_max[h, w](x, y)
+        testing.assert_allclose(y, expected, rtol=1e-6)
+
     @testing.for_all_dtypes(no_bool=True)
     def test_reduce_min(self, dtype):
 
@@ -300,6 +300,23 @@ def dummy_deriv_func(input, axis, output, mode, cval, *args, **kwargs):
     return output
 
 
+# Rank filters given size with partial, unsorted axes: the window dimensions
+# follow the sorted axes, as for an explicit footprint
+@testing.with_requires('scipy>=1.11.0')
+class TestRankFilterUnsortedAxes:
+
+    @pytest.mark.parametrize('rank', [0, 7, -1])
+    @testing.numpy_cupy_allclose(atol=1e-5, rtol=1e-5, scipy_name='scp')
+    def test_rank_filter(self, xp, scp, rank):
+        x = testing.shaped_random((7, 6, 9), xp, numpy.float32)
+        return scp.ndimage.rank_filter(x, rank, size=(3, 5), axes=(2, 0))
+
+    @testing.numpy_cupy_allclose(atol=1e-5, rtol=1e-5, scipy_name='scp')
+    def test_median_filter(self, xp, scp):
+        x = testing.shaped_random((7, 6, 9), xp, numpy.float32)
+        return scp.ndimage.median_filter(x, size=(3, 5), axes=(2, 0))
+
+
 # This tests filters that are very similar to other filters so we only check
 # the basics with them.
 @testing.parameterize(*(
@@ -821,6 +838,27 @@ class TestShellSort(FilterTestCaseBase):
         return self._filter(xp, scp)
 
 
+# Tests dense medium kernels whose rank is too large for the partial selection
+# in rank-based filters
+@testing.parameterize(*(
+    testing.product_dict(
+        testing.product({
+            'filter': ['median_filter'],
+        }),
+        testing.product({
+            'footprint': [False, True],
+            'ksize': [13, 15],
+            'shape': [(20, 21)],
+        })
+    )
+))
+@testing.with_requires('scipy')
+class TestMediumRankWindows(FilterTestCaseBase):
+    @testing.numpy_cupy_allclose(atol=1e-5, rtol=1e-5, scipy_name='scp')
+    def test_filter(self, xp, scp):
+        return self._filter(xp, scp)
+
+
 # Tests with Fortran-ordered arrays
 @testing.parameterize(*(
     testing.product_dict(
@@ -282,6 +282,15 @@ class TestChooseConvMethod:
         assert cupyx.scipy.signal.choose_conv_method(
             a, b, mode=self.mode) == 'fft'
 
+    @testing.for_dtypes('fdFD')
+    def test_choose_conv_method_small(self, dtype):
+        a = testing.shaped_arange((1000,), cupy, dtype)
+        b = testing.shaped_arange((10,), cupy, dtype)
+        assert cupyx.scipy.signal.choose_conv_method(
+            a, b, mode=self.mode) == 'direct'
+        assert cupyx.scipy.signal.choose_conv_method(
+            b, a, mode=self.mode) == 'direct'
+
     @testing.for_int_dtypes()
     def test_choose_conv_method_int(self, dtype):
         a = testing.shaped_arange((10,), cupy, dtype)
@@ -324,13 +333,64 @@ class TestWiener:
         noise = (testing.shaped_random(self.im, xp, dtype)
                  if self.noise else None)
         out = scp.signal.wiener(im, mysize, noise)
-        # Always returns float64 or complex128 data  in both scipy and
-        # cupyx.scipy. Per-datatype tolerances are based on the output
-        # data type but quality is based on input data type (if floating point)
-        assert out.dtype == (np.complex128 if out.dtype.kind == 'c' else
-                             np.float64)
+        # Returns float64 or complex128 data in scipy, while cupyx.scipy keeps
+        # float32 and complex64 inputs in single precision. Per-datatype
+        # tolerances are based on the output data type but quality is based
+        # on input data type (if floating point)
+        if xp is cupy and dtype in (np.float32, np.complex64):
+            assert out.dtype == dtype
+        else:
+            assert out.dtype == (np.complex128 if out.dtype.kind == 'c' else
+                                 np.float64)
         return out.astype(dtype, copy=False) if dtype in self.tols else out
 
+    @testing.for_dtypes('fF')
+    def test_wiener_dtype(self, dtype):
+        im = testing.shaped_random(self.im, cupy, dtype)
+        mysize = self.mysize
+        if isinstance(mysize, tuple):
+            mysize = mysize[:im.ndim]
+        noise = (testing.shaped_random(self.im, cupy, dtype)
+                 if self.noise else None)
+        out_dtype = np.complex128 if im.dtype.kind == 'c' else np.float64
+        out = cupyx.scipy.signal.wiener(im, mysize, noise, dtype=out_dtype)
+        expected = cupyx.scipy.signal.wiener(
+            im.astype(out_dtype), mysize,
+            None if noise is None else noise.astype(out_dtype))
+        assert out.dtype == out_dtype
+        testing.assert_allclose(out, expected)
+
+    def test_wiener_float16(self):
+        im = testing.shaped_random(self.im, cupy, cupy.float32)
+        mysize = self.mysize
+        if isinstance(mysize, tuple):
+            mysize = mysize[:im.ndim]
+        noise = (testing.shaped_random(self.im, cupy, cupy.float32)
+                 if self.noise else None)
+        out = cupyx.scipy.signal.wiener(im, mysize, noise, dtype=cupy.float16)
+        expected = cupyx.scipy.signal.wiener(im, mysize, noise)
+        assert out.dtype == cupy.float16
+        testing.assert_allclose(out, expected, rtol=1e-2, atol=5e-2)
+
+    def test_wiener_float16_offset(self):
+        # 8-bit like data far from zero, where the mean of squares is large
+        # compared with the local variance
+        im = testing.shaped_random(self.im, cupy, cupy.float32) + 100
+        mysize = self.mysize
+        if isinstance(mysize, tuple):
+            mysize = mysize[:im.ndim]
+        noise = (testing.shaped_random(self.im, cupy, cupy.float32)
+                 if self.noise else None)
+        out = cupyx.scipy.signal.wiener(im, mysize, noise, dtype=cupy.float16)
+        expected = cupyx.scipy.signal.wiener(im, mysize, noise)
+        assert out.dtype == cupy.float16
+        testing.assert_allclose(out, expected, rtol=1e-3, atol=1e-1)
+
+    def test_wiener_complex_input_real_dtype(self):
+        im = testing.shaped_random(self.im, cupy, cupy.complex64)
+        with pytest.raises(ValueError):
+            cupyx.scipy.signal.wiener(im, dtype=cupy.float64)
+
 
 @testing.parameterize(*testing.product({
     'a': [(10,), (5, 10), (10, 3), (3, 4, 10)],
@@ -351,6 +411,37 @@ class TestOrderFilter:
         return scp.signal.order_filter(a, domain, rank)
 
 
+@testing.parameterize(*testing.product({
+    'domain_size': [5, 15],
+    'rank': [1, 4, 'median'],
+}))
+@testing.with_requires('scipy')
+class TestOrderFilterSparseDomain:
+    @testing.for_dtypes('lf')
+    @testing.numpy_cupy_allclose(atol=1e-8, rtol=1e-8, scipy_name='scp')
+    def test_order_filter_cross(self, xp, scp, dtype):
+        a = testing.shaped_random((20, 21), xp, dtype)
+        domain = xp.zeros((self.domain_size,) * 2, dtype=bool)
+        domain[self.domain_size // 2, :] = True
+        domain[:, self.domain_size // 2] = True
+        rank = self.rank
+        if rank == 'median':
+            rank = int(domain.sum()) // 2
+        return scp.signal.order_filter(a, domain, rank)
+
+    @testing.for_dtypes('lf')
+    @testing.numpy_cupy_allclose(atol=1e-8, rtol=1e-8, scipy_name='scp')
+    def test_order_filter_corners_removed(self, xp, scp, dtype):
+        # more than 162 non-zeros: median ranks take the shell sort
+        a = testing.shaped_random((20, 21), xp, dtype)
+        domain = xp.ones((self.domain_size,) * 2, dtype=bool)
+        domain[0, 0] = domain[0, -1] = domain[-1, 0] = domain[-1, -1] = False
+        rank = self.rank
+        if rank == 'median':
+            rank = int(domain.sum()) // 2
+        return scp.signal.order_filter(a, domain, rank)
+
+
 @testing.parameterize(*testing.product({
     'volume': [(10,), (5, 10), (10, 5), (5, 6, 10)],
     'kernel_size': [3, 4, (3, 3, 5)],
@@ -412,6 +503,45 @@ class TestMedFilt2d:
         kernel_size = self.kernel_size
         return scp.signal.medfilt2d(input, kernel_size)
 
+    @testing.for_dtypes('Bhifd')
+    def test_medfilt2d_out(self, dtype):
+        if self.kernel_size == 4:
+            pytest.skip('even kernel size')
+        input = testing.shaped_random(self.input, cupy, dtype)
+        expected = cupyx.scipy.signal.medfilt2d(input, self.kernel_size)
+        out = cupy.empty_like(input)
+        res = cupyx.scipy.signal.medfilt2d(input, self.kernel_size, out=out)
+        assert res is out
+        testing.assert_array_equal(out, expected)
+
+
+@testing.parameterize(*testing.product({
+    'input': [(10, 12), (70, 150), (150, 70)],
+    'kernel_size': [15, 17, (15, 31), (41, 19)],
+}))
+@testing.with_requires('scipy')
+class TestMedFilt2dUint8:
+    @testing.numpy_cupy_array_equal(scipy_name='scp')
+    def test_medfilt2d_uint8(self, xp, scp):
+        input = testing.shaped_random(self.input, xp, xp.uint8, scale=256)
+        return scp.signal.medfilt2d(input, self.kernel_size)
+
+    @testing.numpy_cupy_array_equal(scipy_name='scp')
+    def test_medfilt2d_uint8_non_contiguous(self, xp, scp):
+        input = testing.shaped_random(self.input, xp, xp.uint8, scale=256)
+        return scp.signal.medfilt2d(input.T, self.kernel_size)
+
+    def test_medfilt2d_uint8_out(self):
+        input = testing.shaped_random(self.input, cupy, cupy.uint8, scale=256)
+        expected = cupyx.scipy.signal.medfilt2d(input, self.kernel_size)
+        for out in (cupy.empty_like(input),
+                    cupy.empty(input.shape, cupy.float32),
+                    cupy.empty_like(input, order='F')):
+            res = cupyx.scipy.signal.medfilt2d(
+                input, self.kernel_size, out=out)
+            assert res is out
+            testing.assert_array_equal(out, expected)
+
 
 @testing.with_requires('scipy')
 class TestLFilter:
@@ -1043,6 +1173,12 @@ class TestHilbert:
         aan = scp.signal.hilbert(a, N=20, axis=-1)
         return aa, aan
 
+    @pytest.mark.parametrize('N', [None, 3, 5, 9, 11])
+    @testing.numpy_cupy_allclose(scipy_name='scp')
+    def test_hilbert_odd_even_N(self, xp, scp, N):
+        a = testing.shaped_random((4, 7), xp, xp.float64)
+        return scp.signal.hilbert(a, N=N, axis=-1)
+
     @pytest.mark.parametrize('dtype', [np.float32, np.float64])
     @testing.numpy_cupy_allclose(scipy_name='scp')
     @testing.with_requires("scipy>=1.9")